@@ -0,0 +1,68 @@
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bot_utility"))
+
+from prompt_filter import PromptFilter
+
+# Prompt filter benchmark
+# Compares the compiled filter against the old `word in list` scan for
+# blacklists from 10 to 100k entries. Usage: python benchmarks/bench_prompt_filter.py
+
+SIZES = [10, 100, 1_000, 10_000, 100_000]
+PROMPTS = 2_000
+PHRASE_RATIO = 0.2
+
+rng = random.Random(1234)
+
+
+def random_word(length=None):
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(length or rng.randint(4, 10)))
+
+
+def make_blacklist(size):
+    entries = []
+    for _ in range(size):
+        if rng.random() < PHRASE_RATIO:
+            entries.append(' '.join(random_word() for _ in range(rng.randint(2, 4))))
+        else:
+            entries.append(random_word())
+    return entries
+
+
+def make_prompts(blacklist):
+    prompts = []
+    for _ in range(PROMPTS):
+        words = [random_word() for _ in range(rng.randint(8, 40))]
+        if rng.random() < 0.1:
+            words.insert(rng.randrange(len(words)), rng.choice(blacklist))
+        prompts.append(' '.join(words))
+    return prompts
+
+
+def linear_scan(prompt, blacklist):
+    return any(word in blacklist for word in prompt.split())
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(f"{'entries':>8} {'compile ms':>11} {'filter us/prompt':>17} {'list scan us/prompt':>20}")
+    for size in SIZES:
+        blacklist = make_blacklist(size)
+        prompts = make_prompts(blacklist)
+        prompt_filter, compile_time = timed(PromptFilter, blacklist)
+        _, filter_time = timed(lambda: [prompt_filter.search(prompt) for prompt in prompts])
+        _, scan_time = timed(lambda: [linear_scan(prompt, blacklist) for prompt in prompts])
+        print(f"{size:>8} {compile_time * 1000:>11.1f} {filter_time / PROMPTS * 1e6:>17.1f} {scan_time / PROMPTS * 1e6:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bot_utility"))
+
+from prompt_filter import PromptFilter
+
+# Prompt filter regression check
+# The filter gates NSFW images, so a missed match is a real bug.
+# Usage: python benchmarks/check_prompt_filter.py (exits non zero on failure)
+
+BLACKLIST = ['nude', 'porn', 'sex', 'ass', '18+', 'naked woman', 'woman', 'big red dog', 'red dog']
+
+SHOULD_MATCH = {
+    'a nude!': ['nude'],
+    'porn!!': ['porn'],
+    'naked  woman!': ['woman', 'naked woman'],
+    'woman,nude,beach': ['woman', 'nude'],
+    'masterpiece;nude/beach': ['nude'],
+    '(nude:1.5), best quality': ['nude'],
+    's.e.x': ['sex'],
+    'p-o-r-n': ['porn'],
+    'p0rn': ['porn'],
+    'NÜDE': ['nude'],
+    'nu$de': [],
+    '$ex': ['sex'],
+    'a$$': ['ass'],
+    '18+ only': ['18+'],
+    'n@ked woman': ['woman', 'naked woman'],
+    'naked, woman': ['woman', 'naked woman'],
+    'a big red dog': ['big red dog', 'red dog'],
+}
+
+SHOULD_NOT_MATCH = [
+    'a cat sitting on a sofa',
+    'man,beach,sunset',
+    'born in 1818, aged 18',
+    'class of $5 mass',
+    '1girl, 4k, masterpiece!',
+    'sussex countryside',
+    'nudes are not nude-ish',
+]
+
+
+def main():
+    prompt_filter = PromptFilter(BLACKLIST)
+    failures = []
+    for text, expected in SHOULD_MATCH.items():
+        found = prompt_filter.findall(text)
+        if found != expected:
+            failures.append(f"{text!r}: expected {expected}, got {found}")
+    for text in SHOULD_NOT_MATCH:
+        found = prompt_filter.findall(text)
+        if found:
+            failures.append(f"{text!r}: expected no match, got {found}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    checked = len(SHOULD_MATCH) + len(SHOULD_NOT_MATCH)
+    print(f"{checked - len(failures)}/{checked} prompt filter checks passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
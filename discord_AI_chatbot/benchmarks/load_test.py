@@ -0,0 +1,330 @@
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from aiohttp import web
+
+# Load test harness
+# Stands up local fake upstreams (OpenAI compatible API, Prodia, pollinations,
+# nekos.best) and drives the bot's request paths against them at a fixed
+# concurrency. Run from anywhere: python benchmarks/load_test.py --help
+
+BOT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(BOT_ROOT)  # config.yml, lang/ and instructions/ are loaded relative to the bot root
+sys.path.insert(0, BOT_ROOT)
+# ai_utils builds its OpenAI client at import, nothing here talks to the real API
+os.environ.setdefault("API_KEY", "bench")
+
+# 1x1 transparent png
+PNG_BYTES = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000b49444154789c6360000200000500017a5eab3f0000000049454e44ae426082"
+)
+
+TARGETS = ["generate_response", "generate_image_prodia", "poly_image_gen", "imagine_poly", "gif"]
+
+
+# Fake upstreams
+class FakeUpstream:
+    def __init__(self, latency_ms=50, jitter_ms=10, error_rate=0.0, prodia_polls=2):
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.prodia_polls = prodia_polls
+        self.jobs = {}
+        self.hits = 0
+        self.injected = 0
+        self.failed = 0
+        self.runner = None
+        self.base_url = None
+
+    @web.middleware
+    async def _inject(self, request, handler):
+        self.hits += 1
+        await asyncio.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+        if random.random() < self.error_rate:
+            self.injected += 1
+            self.failed += 1
+            return web.json_response({"error": "injected failure"}, status=500)
+        # some targets swallow bad responses, so count every non 2xx here (404s catch route mistakes)
+        try:
+            response = await handler(request)
+        except web.HTTPException:
+            self.failed += 1
+            raise
+        if response.status >= 300:
+            self.failed += 1
+        return response
+
+    async def chat_completions(self, request):
+        body = await request.json()
+        return web.json_response({
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "bench"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "Benchmark reply."},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3},
+        })
+
+    async def prodia_generate(self, request):
+        job_id = f"{random.getrandbits(64):016x}"
+        self.jobs[job_id] = 0
+        return web.json_response({"job": job_id, "status": "queued"})
+
+    async def prodia_job(self, request):
+        job_id = request.match_info["job_id"]
+        polls = self.jobs.get(job_id, 0) + 1
+        self.jobs[job_id] = polls
+        status = "succeeded" if polls > self.prodia_polls else "generating"
+        return web.json_response({"job": job_id, "status": status})
+
+    async def image(self, request):
+        return web.Response(body=PNG_BYTES, content_type="image/png")
+
+    async def nekos(self, request):
+        category = request.match_info["category"]
+        return web.json_response({"results": [{"url": f"{self.base_url}/prodia/{category}.png"}]})
+
+    async def start(self):
+        app = web.Application(middlewares=[self._inject])
+        app.router.add_post("/openai/v1/chat/completions", self.chat_completions)
+        app.router.add_get("/prodia-api/generate", self.prodia_generate)
+        app.router.add_get("/prodia-api/job/{job_id}", self.prodia_job)
+        app.router.add_get("/prodia/{name}", self.image)
+        app.router.add_get("/pollinations/prompt/{prompt}", self.image)
+        app.router.add_get("/nekos/api/v2/{category}", self.nekos)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def stop(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+
+
+# Fake discord context for calling command callbacks directly
+class FakeChannel:
+    nsfw = False
+
+    async def send(self, *args, **kwargs):
+        return None
+
+
+class FakeContext:
+    def __init__(self):
+        self.channel = FakeChannel()
+
+    async def defer(self, *args, **kwargs):
+        return None
+
+    async def send(self, *args, **kwargs):
+        return None
+
+
+class FakeChoice:
+    def __init__(self, value):
+        self.name = value
+        self.value = value
+
+
+# Metrics
+def open_sockets():
+    try:
+        fds = os.listdir("/proc/self/fd")
+    except OSError:
+        return None
+    count = 0
+    for fd in fds:
+        try:
+            if os.readlink(f"/proc/self/fd/{fd}").startswith("socket:"):
+                count += 1
+        except OSError:
+            pass
+    return count
+
+
+async def run_target(name, call, requests, concurrency, upstream):
+    from bot_utilities.loop_monitor import LoopLagMonitor, percentile
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+    peak_sockets = open_sockets()
+
+    async def one():
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await call()
+            except Exception:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - start)
+
+    async def sample_sockets():
+        nonlocal peak_sockets
+        while True:
+            current = open_sockets()
+            if current is not None:
+                peak_sockets = max(peak_sockets or 0, current)
+            await asyncio.sleep(0.05)
+
+    hits, injected, failed = upstream.hits, upstream.injected, upstream.failed
+    monitor = LoopLagMonitor(interval=0.05, window=100_000).start()
+    sampler = asyncio.get_running_loop().create_task(sample_sockets())
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        await asyncio.gather(*[one() for _ in range(requests)])
+    elapsed = time.perf_counter() - start
+    sampler.cancel()
+    await monitor.stop()
+
+    lag = monitor.snapshot()
+    return {
+        "target": name,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "upstream_hits": upstream.hits - hits,
+        "upstream_injected": upstream.injected - injected,
+        "upstream_failed": upstream.failed - failed,
+        "rps": requests / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "peak_sockets": peak_sockets,
+        "loop_lag_p99_ms": lag["p99_ms"],
+        "loop_lag_max_ms": lag["max_ms"],
+    }
+
+
+async def run_load(args):
+    import aiohttp
+    from openai import AsyncOpenAI
+    import bot_utilities.ai_utils as ai_utils
+    import cogs.commands_cogs.AiStuffCog as ai_stuff_cog
+    import cogs.commands_cogs.NekoCog as neko_cog
+
+    upstream = await FakeUpstream(args.latency_ms, args.jitter_ms, args.error_rate, args.prodia_polls).start()
+
+    # Point every upstream at the fake servers
+    ai_utils.client = AsyncOpenAI(base_url=f"{upstream.base_url}/openai/v1", api_key="bench", max_retries=0)
+    ai_utils.prodia_api_url = f"{upstream.base_url}/prodia-api"
+    ai_utils.prodia_image_url = f"{upstream.base_url}/prodia"
+    ai_utils.pollinations_url = f"{upstream.base_url}/pollinations"
+    neko_cog.nekos_api_url = f"{upstream.base_url}/nekos/api/v2/"
+
+    ai_cog = ai_stuff_cog.AiStuffCog(None)
+    gif_cog = neko_cog.NekoCog(None)
+    history = [{"role": "user", "content": "Hello there"}]
+
+    results = []
+    async with aiohttp.ClientSession() as session:
+        calls = {
+            "generate_response": lambda: ai_utils.generate_response("You are a benchmark.", history),
+            "generate_image_prodia": lambda: ai_utils.generate_image_prodia("a cat", "bench", "Euler", 1234, None),
+            "poly_image_gen": lambda: ai_utils.poly_image_gen(session, "a cat"),
+            "imagine_poly": lambda: ai_cog.imagine_poly.callback(ai_cog, FakeContext(), "a cat", args.images),
+            "gif": lambda: gif_cog.gif.callback(gif_cog, FakeContext(), FakeChoice("hug")),
+        }
+        try:
+            for name in args.targets:
+                results.append(await run_target(name, calls[name], args.requests, args.concurrency, upstream))
+        finally:
+            await upstream.stop()
+    return results
+
+
+# Startup time
+STARTUP_SCRIPT = """
+import json, time
+timings = {}
+start = last = time.perf_counter()
+def mark(name):
+    global last
+    now = time.perf_counter()
+    timings[name] = (now - last) * 1000
+    last = now
+import bot_utilities.config_loader
+mark("config_loader")
+import bot_utilities.ai_utils
+mark("ai_utils")
+import cogs.common
+mark("cogs.common")
+import cogs.commands_cogs.AiStuffCog, cogs.commands_cogs.ChatConfigCog, cogs.commands_cogs.NekoCog
+mark("command cogs")
+timings["total"] = (time.perf_counter() - start) * 1000
+print(json.dumps(timings))
+"""
+
+
+def measure_startup(runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT],
+            cwd=BOT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout
+        timings = json.loads(output.strip().splitlines()[-1])
+        timings["interpreter"] = (time.perf_counter() - start) * 1000
+        samples.append(timings)
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+
+def print_results(results, startup):
+    header = f"{'target':<22} {'reqs':>6} {'conc':>5} {'err':>5} {'hits':>7} {'inj':>5} {'non2xx':>6} {'rps':>9} {'p50 ms':>9} {'p99 ms':>9} {'sockets':>8} {'lag p99':>8} {'lag max':>8}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        sockets = "n/a" if r["peak_sockets"] is None else r["peak_sockets"]
+        print(f"{r['target']:<22} {r['requests']:>6} {r['concurrency']:>5} {r['errors']:>5} {r['upstream_hits']:>7} {r['upstream_injected']:>5} {r['upstream_failed']:>6} {r['rps']:>9.1f} "
+              f"{r['p50_ms']:>9.1f} {r['p99_ms']:>9.1f} {sockets:>8} {r['loop_lag_p99_ms']:>8.1f} {r['loop_lag_max_ms']:>8.1f}")
+    if startup:
+        print("\nStartup (median ms)")
+        for key, value in startup.items():
+            print(f"  {key:<16} {value:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the bot against local fake upstreams.")
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=TARGETS)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=10)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of upstream responses that return HTTP 500")
+    parser.add_argument("--prodia-polls", type=int, default=2, help="polls before a Prodia job succeeds")
+    parser.add_argument("--images", type=int, default=4, help="images per imagine_poly call")
+    parser.add_argument("--startup-runs", type=int, default=5, help="0 skips the startup measurement")
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_load(args))
+    startup = measure_startup(args.startup_runs) if args.startup_runs else None
+
+    if args.json:
+        print(json.dumps({"load": results, "startup": startup}, indent=4))
+    else:
+        print_results(results, startup)
+
+
+if __name__ == "__main__":
+    main()
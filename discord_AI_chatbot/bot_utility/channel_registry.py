@@ -0,0 +1,165 @@
+import asyncio
+import json
+import os
+
+# Active channel registry
+# channels.json is read once and kept in memory, lookups are plain dict lookups.
+# Changes are written back by a debounced task (temp file + rename) in a worker
+# thread, and the file is polled so external edits are picked up. If the file
+# was edited while a save was pending, the pending changes are merged on top of it.
+
+_REMOVED = object()
+
+
+class ChannelRegistry:
+    def __init__(self, path="channels.json", save_delay=2.0, poll_interval=5.0):
+        self.path = path
+        self.save_delay = save_delay
+        self.poll_interval = poll_interval
+        # channel id -> persona (or _REMOVED) changed since the last successful save
+        self._changes = {}
+        self._flush_now = asyncio.Event()
+        self._save_task = None
+        self._watch_task = None
+        self._channels, self._mtime = self._read()
+
+    # Lookups
+    def __contains__(self, channel_id):
+        return str(channel_id) in self._channels
+
+    def __getitem__(self, channel_id):
+        return self._channels[str(channel_id)]
+
+    def __len__(self):
+        return len(self._channels)
+
+    def __iter__(self):
+        return iter(self._channels)
+
+    def get(self, channel_id, default=None):
+        return self._channels.get(str(channel_id), default)
+
+    # Changes
+    def __setitem__(self, channel_id, persona):
+        self._channels[str(channel_id)] = persona
+        self._changes[str(channel_id)] = persona
+        self._schedule_save()
+
+    def __delitem__(self, channel_id):
+        del self._channels[str(channel_id)]
+        self._changes[str(channel_id)] = _REMOVED
+        self._schedule_save()
+
+    def toggle(self, channel_id, persona) -> bool:
+        """Activates the channel with persona, or deactivates it if it was active. Returns the new state."""
+        if channel_id in self:
+            del self[channel_id]
+            return False
+        self[channel_id] = persona
+        return True
+
+    # Lifecycle
+    def start(self):
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.get_running_loop().create_task(self._watch())
+
+    async def stop(self):
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            self._watch_task = None
+        await self.flush()
+
+    async def flush(self):
+        task = self._save_task
+        if task is not None and not task.done():
+            self._flush_now.set()
+            await task
+            self._flush_now.clear()
+
+    # Persistence
+    def _current_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _read(self):
+        mtime = self._current_mtime()
+        if mtime is None:
+            return {}, None
+        with open(self.path, "r", encoding='utf-8') as f:
+            return json.load(f), mtime
+
+    @staticmethod
+    def _apply(channels, changes):
+        for channel_id, persona in changes.items():
+            if persona is _REMOVED:
+                channels.pop(channel_id, None)
+            else:
+                channels[channel_id] = persona
+
+    def _write(self, channels, changes, known_mtime):
+        merged = False
+        if self._current_mtime() != known_mtime:
+            # edited behind our back since the last load/save, keep those edits
+            try:
+                channels, _ = self._read()
+            except json.JSONDecodeError as e:
+                print(f"\033[1;31m(Channels) Overwriting unreadable external change to {self.path} :\033[0m {e}")
+            else:
+                self._apply(channels, changes)
+                merged = True
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding='utf-8') as f:
+            json.dump(channels, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        return channels, self._current_mtime(), merged
+
+    def _pending(self):
+        return self._save_task is not None and not self._save_task.done()
+
+    def _schedule_save(self):
+        if not self._pending():
+            self._save_task = asyncio.get_running_loop().create_task(self._save())
+
+    async def _save(self):
+        try:
+            await asyncio.wait_for(self._flush_now.wait(), self.save_delay)
+        except asyncio.TimeoutError:
+            pass
+        # changes made while a write is in flight are picked up by the next round
+        while self._changes:
+            changes, self._changes = self._changes, {}
+            try:
+                channels, self._mtime, merged = await asyncio.to_thread(
+                    self._write, dict(self._channels), changes, self._mtime)
+            except OSError as e:
+                # keep the changes (newer ones win) and try again later
+                changes.update(self._changes)
+                self._changes = changes
+                print(f"\033[1;31m(Channels) Failed to save {self.path} :\033[0m {e}")
+                if self._flush_now.is_set():
+                    return
+                await asyncio.sleep(self.save_delay)
+                continue
+            if merged:
+                self._apply(channels, self._changes)
+                self._channels = channels
+                print(f"\033[1;33m(Channels) Merged external changes to {self.path}\033[0m")
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            # while a save is pending, external edits are merged by the save instead
+            if self._pending() or self._current_mtime() == self._mtime:
+                continue
+            try:
+                channels, mtime = await asyncio.to_thread(self._read)
+            except (OSError, json.JSONDecodeError) as e:
+                # half written by someone else, try again on the next poll
+                print(f"\033[1;31m(Channels) Failed to reload {self.path} :\033[0m {e}")
+                continue
+            if not self._pending():
+                self._channels, self._mtime = channels, mtime
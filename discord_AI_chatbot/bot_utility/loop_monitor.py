@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+
+def percentile(values, pct) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+# Event loop lag monitor
+# Sleeps for a fixed interval and records how late the loop woke it up.
+# Anything blocking the loop (sync network calls, encoding, disk IO) shows up as lag.
+
+class LoopLagMonitor:
+    def __init__(self, interval=0.25, window=240):
+        self.interval = interval
+        self.window = window
+        self.samples = []
+        self.max_lag = 0.0
+        self._task = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - expected)
+            self.samples.append(lag)
+            if len(self.samples) > self.window:
+                del self.samples[0]
+            self.max_lag = max(self.max_lag, lag)
+
+    @property
+    def last_lag(self) -> float:
+        return self.samples[-1] if self.samples else 0.0
+
+    def percentile(self, pct) -> float:
+        return percentile(self.samples, pct)
+
+    def snapshot(self) -> dict:
+        return {
+            "last_ms": self.last_lag * 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max_lag * 1000,
+        }
+
+
+loop_lag_monitor = LoopLagMonitor()
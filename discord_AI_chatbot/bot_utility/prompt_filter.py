@@ -0,0 +1,137 @@
+import re
+import unicodedata
+from collections import deque
+
+# Blacklist filter
+# Entries are compiled once: single words go into a set, multi word phrases
+# into an Aho-Corasick automaton over tokens. A scan is one pass over the
+# tokens of the text, whatever the size of the blacklist.
+
+LEET_DIGITS = str.maketrans({
+    '0': 'o', '1': 'i', '3': 'e', '4': 'a', '5': 's', '7': 't', '8': 'b',
+})
+LEET_SYMBOLS = {'@': 'a', '$': 's', '!': 'i', '|': 'l', '+': 't'}
+# the ones that still read as letters at the edge of a word ("$ex", "a$$"),
+# "!" and "|" there are ordinary punctuation
+LEET_EDGE_SYMBOLS = {'@': 'a', '$': 's'}
+
+# comma separated tags are the usual prompt format, these always split words
+_separators = re.compile(r'[\s,;:/\\()\[\]{}<>"\'`=~^&#%?]+')
+
+
+def _normalize_word(word):
+    start = 0
+    end = len(word)
+    # punctuation around a word is just punctuation, "nude!" is "nude"
+    while start < end and not word[start].isalnum():
+        start += 1
+    while end > start and not word[end - 1].isalnum():
+        end -= 1
+    core = word[start:end]
+    chars = []
+    for index, char in enumerate(core):
+        if char.isalnum():
+            chars.append(char)
+        elif char in LEET_SYMBOLS and core[index - 1].isalnum() and core[index + 1].isalnum():
+            chars.append(LEET_SYMBOLS[char])
+        # anything else inside a word is dropped, so "s.e.x" / "p-o-r-n" collapse
+    core = ''.join(chars)
+    if not core:
+        return core
+    if core.isdigit():
+        # "18+" is its own token, not "18"
+        return core + '+' if word[end:end + 1] == '+' else core
+
+    prefix = ''
+    while start > 0 and word[start - 1] in LEET_EDGE_SYMBOLS:
+        start -= 1
+        prefix = LEET_EDGE_SYMBOLS[word[start]] + prefix
+    suffix = ''
+    while end < len(word) and word[end] in LEET_EDGE_SYMBOLS:
+        suffix += LEET_EDGE_SYMBOLS[word[end]]
+        end += 1
+    return (prefix + core + suffix).translate(LEET_DIGITS)
+
+
+def _fold(text):
+    # fold accents and lookalike forms (NFKD + drop combining marks) and case
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in text if not unicodedata.combining(char)).casefold()
+
+
+def normalize_tokens(text) -> list:
+    tokens = []
+    for word in _separators.split(_fold(text)):
+        word = _normalize_word(word)
+        if word:
+            tokens.append(word)
+    return tokens
+
+
+class PromptFilter:
+    def __init__(self, entries):
+        self.words = {}
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for entry in entries or []:
+            tokens = normalize_tokens(str(entry))
+            if not tokens:
+                print(f"\033[1;31m(Filter) Dropped blacklist entry {entry!r} :\033[0m nothing left after normalization")
+                continue
+            if ' '.join(tokens) != ' '.join(_fold(str(entry)).split()):
+                print(f"\033[1;33m(Filter) Blacklist entry {entry!r} is matched as :\033[0m {' '.join(tokens)!r}")
+            if len(tokens) == 1:
+                self.words.setdefault(tokens[0], entry)
+            else:
+                self._add_phrase(tokens, entry)
+        self._build_links()
+
+    def _add_phrase(self, tokens, entry):
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][token] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        if not self._output[state]:
+            self._output[state].append(entry)
+
+    def _build_links(self):
+        # breadth first so every fail link points at an already finished state
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(token, 0)
+                # shorter phrases ending here (the fail chain) match too
+                if self._output[self._fail[child]]:
+                    self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def _scan(self, text):
+        words = self.words
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for token in normalize_tokens(text):
+            if token in words:
+                yield words[token]
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            yield from output[state]
+
+    def search(self, text):
+        return next(self._scan(text), None)
+
+    def findall(self, text) -> list:
+        return list(self._scan(text))
@@ -0,0 +1,147 @@
+import asyncio
+import hashlib
+import io
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from langdetect import detect, DetectorFactory
+from langdetect.detector_factory import init_factory
+from gtts import gTTS
+from bot_utilities.config_loader import config
+
+# TTS config
+tts_workers = config.get('TTS_WORKERS', 4)
+tts_cache_dir = config.get('TTS_CACHE_DIR', 'tts_cache')
+tts_cache_max_bytes = config.get('TTS_CACHE_MAX_MB', 64) * 1024 * 1024
+tts_chunk_size = config.get('TTS_CHUNK_SIZE', 400)
+
+# langdetect is random by default, pin it so the cache key is stable
+DetectorFactory.seed = 0
+# its profiles load lazily and not thread safely, load them before the pool uses detect()
+init_factory()
+
+# detect() and gTTS are blocking, they run here instead of on the event loop
+tts_executor = ThreadPoolExecutor(max_workers=tts_workers, thread_name_prefix="tts")
+
+_sentence_end = re.compile(r'(?<=[.!?;:。！？])\s+')
+
+
+def chunk_text(text, size=tts_chunk_size) -> list:
+    chunks = []
+    current = ''
+    for sentence in _sentence_end.split(text.strip()):
+        if len(sentence) > size and current:
+            chunks.append(current)
+            current = ''
+        while len(sentence) > size:
+            cut = sentence.rfind(' ', 0, size)
+            if cut <= 0:
+                cut = size
+            chunks.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if current and len(current) + len(sentence) + 1 > size:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}".strip()
+    if current:
+        chunks.append(current)
+    return [chunk for chunk in chunks if chunk]
+
+
+def _synthesize(text, lang) -> bytes:
+    buffer = io.BytesIO()
+    gTTS(text=text, lang=lang).write_to_fp(buffer)
+    return buffer.getvalue()
+
+
+# Disk cache
+def _cache_path(text, lang):
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    return os.path.join(tts_cache_dir, f"{digest}.{lang}.mp3")
+
+
+def _cache_read(path):
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    # bump mtime so eviction drops the least recently used entries first
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+    return data
+
+
+def _cache_write(path, data):
+    os.makedirs(tts_cache_dir, exist_ok=True)
+    # unique temp file per writer, the pool threads may write the same entry at once
+    fd, tmp_path = tempfile.mkstemp(dir=tts_cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    _cache_evict()
+
+
+def _cache_evict():
+    entries = []
+    total = 0
+    with os.scandir(tts_cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith('.mp3') and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+    entries.sort()
+    for _, size, path in entries:
+        if total <= tts_cache_max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+# cache path -> task rendering it, so identical texts are synthesized once
+_in_flight = {}
+
+
+async def _render(path, text, lang):
+    loop = asyncio.get_running_loop()
+    audio = await loop.run_in_executor(tts_executor, _cache_read, path)
+    if audio is None:
+        # chunks are independent mp3 streams, gTTS itself joins them the same way
+        parts = await asyncio.gather(*[
+            loop.run_in_executor(tts_executor, _synthesize, chunk, lang)
+            for chunk in chunk_text(text)
+        ])
+        audio = b''.join(parts)
+        await loop.run_in_executor(tts_executor, _cache_write, path, audio)
+    return audio
+
+
+async def text_to_speech(text):
+    loop = asyncio.get_running_loop()
+    detected_language = await loop.run_in_executor(tts_executor, detect, text)
+    path = _cache_path(text, detected_language)
+
+    task = _in_flight.get(path)
+    if task is None:
+        task = loop.create_task(_render(path, text, detected_language))
+        _in_flight[path] = task
+        task.add_done_callback(lambda _: _in_flight.pop(path, None))
+    # shielded so one cancelled caller does not cancel the others waiting on it
+    audio = await asyncio.shield(task)
+
+    bytes_obj = io.BytesIO(audio)
+    bytes_obj.seek(0)
+    return bytes_obj
@@ -6,7 +6,7 @@ import asyncio
 import random
 from bot_utilities.ai_utils import poly_image_gen, generate_image_prodia
 from prodia.constants import Model
-from ..common import blacklisted_words
+from ..common import prompt_filter
 
 
 class AiStuffCog(commands.Cog):
@@ -76,8 +76,7 @@ class AiStuffCog(commands.Cog):
     )
     @commands.guild_only()
     async def imagine(self, ctx, prompt: str, model: discord.app_commands.Choice[str], sampler: discord.app_commands.Choice[str], negative: str = None, seed: int = None):
-        for word in prompt.split():
-            is_nsfw = word in blacklisted_words
+        is_nsfw = prompt_filter.search(prompt) is not None
         if seed is None:
             seed = random.randint(10000, 99999)
         await ctx.defer()
@@ -3,12 +3,20 @@ from discord.ext import commands
 
 
 from ..common import current_language
+from bot_utilities.loop_monitor import loop_lag_monitor
 
 
 class HelpCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    async def cog_load(self):
+        # cogs are loaded from setup_hook, so this runs once at startup
+        loop_lag_monitor.start()
+
+    async def cog_unload(self):
+        await loop_lag_monitor.stop()
+
     @commands.hybrid_command(name="help", description=current_language["help"])
     async def help(self, ctx):
         embed = discord.Embed(title="Bot Commands", color=0x03a64b)
@@ -25,6 +33,14 @@ class HelpCog(commands.Cog):
         
         await ctx.send(embed=embed)
 
+    @commands.hybrid_command(name="ping", description=current_language.get("ping", "Shows the bot latency and event loop lag"))
+    async def ping(self, ctx):
+        lag = loop_lag_monitor.snapshot()
+        embed = discord.Embed(title="🏓 Pong", color=0x03a64b)
+        embed.add_field(name="Gateway latency", value=f"{self.bot.latency * 1000:.0f} ms", inline=False)
+        embed.add_field(name="Event loop lag", value=f"last {lag['last_ms']:.1f} ms, p50 {lag['p50_ms']:.1f} ms, p99 {lag['p99_ms']:.1f} ms, max {lag['max_ms']:.1f} ms", inline=False)
+        await ctx.send(embed=embed)
+
 
 async def setup(bot):
     await bot.add_cog(HelpCog(bot))
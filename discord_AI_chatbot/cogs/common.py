@@ -2,7 +2,7 @@ import discord
 from discord.ext import commands
 import aiohttp
 
-from ..common import current_language
+from ..common import current_language, nekos_api_url
 
 
 class NekoCog(commands.Cog):
@@ -15,9 +15,7 @@ class NekoCog(commands.Cog):
         for category in ['baka', 'bite', 'blush', 'bored', 'cry', 'cuddle', 'dance', 'facepalm', 'feed', 'handhold', 'happy', 'highfive', 'hug', 'kick', 'kiss', 'laugh', 'nod', 'nom', 'nope', 'pat', 'poke', 'pout', 'punch', 'shoot', 'shrug']
     ])
     async def gif(self, ctx, category: discord.app_commands.Choice[str]):
-        base_url = "https://nekos.best/api/v2/"
-
-        url = base_url + category.value
+        url = nekos_api_url + category.value
 
         async with aiohttp.ClientSession() as session:
             async with session.get(url) as response:
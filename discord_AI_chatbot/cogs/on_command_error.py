@@ -1,10 +1,11 @@
 from bot_utilities.config_loader import load_current_language, load_instructions, config
+from bot_utilities.prompt_filter import PromptFilter
+from bot_utilities.channel_registry import ChannelRegistry
 
 # Chatbot and discord config
 
 instructions = load_instructions()
 allow_dm = config['ALLOW_DM']
-active_channels = set()
 trigger_words = config['TRIGGER']
 smart_mention = config['SMART_MENTION']
 presences = config["PRESENCES"]
@@ -16,10 +17,14 @@ instruc_config = config['DEFAULT_INSTRUCTION']
 message_history = {}
 MAX_HISTORY = config['MAX_HISTORY']
 replied_messages = {}
-active_channels = {}
+active_channels = ChannelRegistry("channels.json")
+
+# Upstream endpoints
+nekos_api_url = config.get('NEKOS_API_URL', 'https://nekos.best/api/v2/')
 
 # Imagine config
 blacklisted_words = config['BLACKLIST_WORDS']
+prompt_filter = PromptFilter(blacklisted_words)
 prevent_nsfw = config['AI_NSFW_CONTENT_FILTER']
 
 # Accessability
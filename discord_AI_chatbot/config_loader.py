@@ -4,10 +4,9 @@ import time
 import os
 import random
 import json
-from langdetect import detect
-from gtts import gTTS
 from urllib.parse import quote
 from bot_utilities.config_loader import load_current_language, config
+from bot_utilities.tts_utils import text_to_speech
 from openai import AsyncOpenAI
 from duckduckgo_search import AsyncDDGS
 from dotenv import load_dotenv
@@ -17,6 +16,11 @@ load_dotenv()
 current_language = load_current_language()
 internet_access = config['INTERNET_ACCESS']
 
+# Upstream endpoints
+prodia_api_url = config.get('PRODIA_API_URL', 'https://api.prodia.com')
+prodia_image_url = config.get('PRODIA_IMAGE_URL', 'https://images.prodia.xyz')
+pollinations_url = config.get('POLLINATIONS_URL', 'https://image.pollinations.ai')
+
 client = AsyncOpenAI(
     base_url=config['API_BASE_URL'],
     api_key=os.environ.get("API_KEY"),
@@ -99,7 +103,7 @@ async def duckduckgotool(query) -> str:
 
 async def poly_image_gen(session, prompt):
     seed = random.randint(1, 100000)
-    image_url = f"https://image.pollinations.ai/prompt/{prompt}?seed={seed}"
+    image_url = f"{pollinations_url}/prompt/{prompt}?seed={seed}"
     async with session.get(image_url) as response:
         image_data = await response.read()
         return io.BytesIO(image_data)
@@ -112,7 +116,7 @@ async def generate_image_prodia(prompt, model, sampler, seed, neg):
             negative = "(nsfw:1.5),verybadimagenegative_v1.3, ng_deepnegative_v1_75t, (ugly face:0.8),cross-eyed,sketches, (worst quality:2), (low quality:2), (normal quality:2), lowres, normal quality, ((monochrome)), ((grayscale)), skin spots, acnes, skin blemishes, bad anatomy, DeepNegative, facing away, tilted head, {Multiple people}, lowres, bad anatomy, bad hands, text, error, missing fingers, extra digit, fewer digits, cropped, worstquality, low quality, normal quality, jpegartifacts, signature, watermark, username, blurry, bad feet, cropped, poorly drawn hands, poorly drawn face, mutation, deformed, worst quality, low quality, normal quality, jpeg artifacts, signature, watermark, extra fingers, fewer digits, extra limbs, extra arms,extra legs, malformed limbs, fused fingers, too many fingers, long neck, cross-eyed,mutated hands, polar lowres, bad body, bad proportions, gross proportions, text, error, missing fingers, missing arms, missing legs, extra digit, extra arms, extra leg, extra foot, repeating hair, nsfw, [[[[[bad-artist-anime, sketch by bad-artist]]]]], [[[mutation, lowres, bad hands, [text, signature, watermark, username], blurry, monochrome, grayscale, realistic, simple background, limited palette]]], close-up, (swimsuit, cleavage, armpits, ass, navel, cleavage cutout), (forehead jewel:1.2), (forehead mark:1.5), (bad and mutated hands:1.3), (worst quality:2.0), (low quality:2.0), (blurry:2.0), multiple limbs, bad anatomy, (interlocked fingers:1.2),(interlocked leg:1.2), Ugly Fingers, (extra digit and hands and fingers and legs and arms:1.4), crown braid, (deformed fingers:1.2), (long fingers:1.2)"
         else:
             negative = neg
-        url = 'https://api.prodia.com/generate'
+        url = f'{prodia_api_url}/generate'
         params = {
             'new': 'true',
             'prompt': f'{quote(prompt)}',
@@ -131,7 +135,7 @@ async def generate_image_prodia(prompt, model, sampler, seed, neg):
                 return data['job']
             
     job_id = await create_job(prompt, model, sampler, seed, neg)
-    url = f'https://api.prodia.com/job/{job_id}'
+    url = f'{prodia_api_url}/job/{job_id}'
     headers = {
         'authority': 'api.prodia.com',
         'accept': '*/*',
@@ -142,17 +146,9 @@ async def generate_image_prodia(prompt, model, sampler, seed, neg):
             async with session.get(url, headers=headers) as response:
                 json = await response.json()
                 if json['status'] == 'succeeded':
-                    async with session.get(f'https://images.prodia.xyz/{job_id}.png?download=1', headers=headers) as response:
+                    async with session.get(f'{prodia_image_url}/{job_id}.png?download=1', headers=headers) as response:
                         content = await response.content.read()
                         img_file_obj = io.BytesIO(content)
                         duration = time.time() - start_time
                         print(f"\033[1;34m(Prodia) Finished image creation\n\033[0mJob id : {job_id}  Prompt : ", prompt, "in", duration, "seconds.")
                         return img_file_obj
-
-async def text_to_speech(text):
-    bytes_obj = io.BytesIO()
-    detected_language = detect(text)
-    tts = gTTS(text=text, lang=detected_language)
-    tts.write_to_fp(bytes_obj)
-    bytes_obj.seek(0)
-    return bytes_obj
\ No newline at end of file
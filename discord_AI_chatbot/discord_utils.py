@@ -39,6 +39,7 @@ def load_instructions() -> dict:
     return instructions
 
 def load_active_channels() -> dict:
+    active_channels = {}
     if os.path.exists("channels.json"):
         with open("channels.json", "r", encoding='utf-8') as f:
             active_channels = json.load(f)